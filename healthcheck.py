@@ -13,95 +13,116 @@ import os
 import sys
 import asyncio
 import httpx
+import orjson
 import time
 from typing import Dict, Any
 from datetime import datetime
+from importlib.util import find_spec
+
+try:
+    import psutil
+except ImportError:  # optional; system resource check is skipped without it
+    psutil = None
+
+# Environment snapshot taken once at import; nothing below re-reads os.environ
+_ENV = dict(os.environ)
+
+_REQUIRED_VARS = ("CHANGEDETECTION_URL", "CHANGEDETECTION_API_KEY")
+_OPTIONAL_VARS = ("LOG_LEVEL", "RATE_LIMIT_ENABLED", "ENABLE_METRICS")
+
+_REQUIRED_STATUS = {
+    var: "configured" if _ENV.get(var) else "missing" for var in _REQUIRED_VARS
+}
+_MISSING_OPTIONAL = tuple(var for var in _OPTIONAL_VARS if not _ENV.get(var))
+
+# Upper bound for any single check, so one stuck dependency cannot stall the probe
+_PER_CHECK_TIMEOUT = float(
+    _ENV.get("HEALTH_CHECK_PER_CHECK_TIMEOUT", _ENV.get("HEALTH_CHECK_TIMEOUT", "5.0"))
+)
+
+
+# Dependencies cannot change while the process runs, so probe them once
+_REQUIRED_MODULES = {
+    "mcp": "mcp",
+    "httpx": "httpx",
+    "orjson": "orjson",
+    "dotenv": "python-dotenv",
+}
+_MISSING_PACKAGES = tuple(
+    package for module, package in _REQUIRED_MODULES.items() if find_spec(module) is None
+)
 
 
 class HealthChecker:
     """Comprehensive health checker for the MCP server."""
 
     def __init__(self):
-        self.base_url = os.getenv("CHANGEDETECTION_URL", "http://localhost:5000")
-        self.api_key = os.getenv("CHANGEDETECTION_API_KEY", "")
-        self.timeout = float(os.getenv("HEALTH_CHECK_TIMEOUT", "5.0"))
+        self.base_url = _ENV.get("CHANGEDETECTION_URL", "http://localhost:5000")
+        self.api_key = _ENV.get("CHANGEDETECTION_API_KEY", "")
+        self.timeout = float(_ENV.get("HEALTH_CHECK_TIMEOUT", "5.0"))
         self.checks_passed = 0
         self.checks_failed = 0
         self.warnings = []
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"x-api-key": self.api_key} if self.api_key else None,
+            timeout=self.timeout,
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
 
     async def check_environment(self) -> Dict[str, Any]:
         """Check required environment variables."""
-        status = "healthy"
-        details = {}
-        
-        # Required variables
-        required_vars = ["CHANGEDETECTION_URL", "CHANGEDETECTION_API_KEY"]
-        
-        for var in required_vars:
-            value = os.getenv(var)
-            if not value:
-                status = "unhealthy"
-                details[var] = "missing"
-                self.checks_failed += 1
-            else:
-                details[var] = "configured"
-                self.checks_passed += 1
+        missing = sum(1 for value in _REQUIRED_STATUS.values() if value == "missing")
+        self.checks_failed += missing
+        self.checks_passed += len(_REQUIRED_STATUS) - missing
         
         # Optional but recommended
-        optional_vars = ["LOG_LEVEL", "RATE_LIMIT_ENABLED", "ENABLE_METRICS"]
-        for var in optional_vars:
-            value = os.getenv(var)
-            if not value:
-                self.warnings.append(f"{var} not set, using defaults")
+        for var in _MISSING_OPTIONAL:
+            self.warnings.append(f"{var} not set, using defaults")
         
         return {
             "check": "environment",
-            "status": status,
-            "details": details,
+            "status": "unhealthy" if missing else "healthy",
+            "details": dict(_REQUIRED_STATUS),
         }
 
     async def check_changedetection_api(self) -> Dict[str, Any]:
         """Check connectivity to changedetection.io API."""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            headers = {"x-api-key": self.api_key} if self.api_key else {}
-            url = f"{self.base_url}/api/v1/systeminfo"
+            response = await self._client.get("/api/v1/systeminfo")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-                
-                response_time = time.time() - start_time
+            response_time_ms = round((time.perf_counter_ns() - start_ns) / 1_000_000, 2)
+            
+            if response.status_code == 200:
+                self.checks_passed += 1
+                return {
+                    "check": "changedetection_api",
+                    "status": "healthy",
+                    "response_time_ms": response_time_ms,
+                    "api_version": response.json().get("version", "unknown"),
+                }
+            elif response.status_code == 401:
+                self.checks_failed += 1
+                return {
+                    "check": "changedetection_api",
+                    "status": "unhealthy",
+                    "error": "authentication_failed",
+                    "message": "Invalid or missing API key",
+                }
+            else:
+                self.checks_failed += 1
+                return {
+                    "check": "changedetection_api",
+                    "status": "unhealthy",
+                    "error": f"http_error_{response.status_code}",
+                    "response_time_ms": response_time_ms,
+                }
                 
-                if response.status_code == 200:
-                    self.checks_passed += 1
-                    return {
-                        "check": "changedetection_api",
-                        "status": "healthy",
-                        "response_time_ms": round(response_time * 1000, 2),
-                        "api_version": response.json().get("version", "unknown"),
-                    }
-                elif response.status_code == 401:
-                    self.checks_failed += 1
-                    return {
-                        "check": "changedetection_api",
-                        "status": "unhealthy",
-                        "error": "authentication_failed",
-                        "message": "Invalid or missing API key",
-                    }
-                else:
-                    self.checks_failed += 1
-                    return {
-                        "check": "changedetection_api",
-                        "status": "unhealthy",
-                        "error": f"http_error_{response.status_code}",
-                        "response_time_ms": round(response_time * 1000, 2),
-                    }
-                    
         except httpx.TimeoutException:
             self.checks_failed += 1
             return {
@@ -129,33 +150,23 @@ class HealthChecker:
 
     async def check_dependencies(self) -> Dict[str, Any]:
         """Check Python dependencies."""
-        status = "healthy"
-        missing = []
-        
-        required_modules = {
-            "mcp": "mcp",
-            "httpx": "httpx",
-            "dotenv": "python-dotenv",
-        }
-        
-        for module, package in required_modules.items():
-            try:
-                __import__(module)
-                self.checks_passed += 1
-            except ImportError:
-                missing.append(package)
-                status = "unhealthy"
-                self.checks_failed += 1
+        self.checks_failed += len(_MISSING_PACKAGES)
+        self.checks_passed += len(_REQUIRED_MODULES) - len(_MISSING_PACKAGES)
         
         return {
             "check": "dependencies",
-            "status": status,
-            "missing_packages": missing if missing else None,
+            "status": "unhealthy" if _MISSING_PACKAGES else "healthy",
+            "missing_packages": list(_MISSING_PACKAGES) if _MISSING_PACKAGES else None,
         }
 
     async def check_system_resources(self) -> Dict[str, Any]:
         """Check system resources."""
-        import psutil
+        if psutil is None:
+            return {
+                "check": "system_resources",
+                "status": "skipped",
+                "message": "psutil not installed",
+            }
         
         try:
             # CPU usage
@@ -197,13 +208,6 @@ class HealthChecker:
                 "disk_percent": round(disk_percent, 2),
                 "warnings": warnings if warnings else None,
             }
-        except ImportError:
-            # psutil not installed, skip this check
-            return {
-                "check": "system_resources",
-                "status": "skipped",
-                "message": "psutil not installed",
-            }
         except Exception as e:
             return {
                 "check": "system_resources",
@@ -211,16 +215,32 @@ class HealthChecker:
                 "error": str(e),
             }
 
+    async def _run_with_timeout(self, name: str, check) -> Dict[str, Any]:
+        """Run a single check, reporting it unhealthy if it exceeds its budget."""
+        try:
+            return await asyncio.wait_for(check, timeout=_PER_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.checks_failed += 1
+            return {
+                "check": name,
+                "status": "unhealthy",
+                "error": "timeout",
+                "message": f"Check exceeded {_PER_CHECK_TIMEOUT}s budget",
+            }
+
     async def run_all_checks(self) -> Dict[str, Any]:
         """Run all health checks."""
         start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         # Run checks concurrently
         results = await asyncio.gather(
-            self.check_environment(),
-            self.check_changedetection_api(),
-            self.check_dependencies(),
-            self.check_system_resources(),
+            self._run_with_timeout("environment", self.check_environment()),
+            self._run_with_timeout(
+                "changedetection_api", self.check_changedetection_api()
+            ),
+            self._run_with_timeout("dependencies", self.check_dependencies()),
+            self._run_with_timeout("system_resources", self.check_system_resources()),
         )
         
         # Determine overall status
@@ -233,8 +253,7 @@ class HealthChecker:
         else:
             overall_status = "healthy"
         
-        end_time = datetime.utcnow()
-        duration_ms = (end_time - start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         return {
             "status": overall_status,
@@ -257,11 +276,13 @@ class HealthChecker:
 async def main():
     """Run health check and exit with appropriate code."""
     checker = HealthChecker()
-    result = await checker.run_all_checks()
+    try:
+        result = await checker.run_all_checks()
+    finally:
+        await checker.aclose()
     
     # Print JSON output
-    import json
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
     
     # Exit with appropriate code
     if result["status"] == "unhealthy":
@@ -14,41 +14,51 @@ Features:
 """
 
 import os
+import re
 import sys
-import json
 import time
+import atexit
+import queue
+from io import TextIOWrapper
 from typing import Any, Optional, Dict
-from datetime import datetime
-from collections import defaultdict
+import anyio
 import httpx
+import orjson
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 from mcp.server.stdio import stdio_server
 import asyncio
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from functools import wraps
 
 # ============================================================================
 # Configuration
 # ============================================================================
 
+# Environment snapshot taken once at import; settings below read from it
+_ENV = dict(os.environ)
+
 # Server configuration
 SERVER_VERSION = "1.0.0"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-DEBUG_MODE = os.getenv("DEBUG", "false").lower() == "true"
+LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
+DEBUG_MODE = _ENV.get("DEBUG", "false").lower() == "true"
 
 # Changedetection.io API configuration
-BASE_URL = os.getenv("CHANGEDETECTION_URL", "http://localhost:5000")
-API_KEY = os.getenv("CHANGEDETECTION_API_KEY", "")
+BASE_URL = _ENV.get("CHANGEDETECTION_URL", "http://localhost:5000")
+API_KEY = _ENV.get("CHANGEDETECTION_API_KEY", "")
 
 # Rate limiting configuration
-RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
-RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
-RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))
+RATE_LIMIT_ENABLED = _ENV.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_PER_MINUTE = int(_ENV.get("RATE_LIMIT_PER_MINUTE", "60"))
+RATE_LIMIT_BURST = int(_ENV.get("RATE_LIMIT_BURST", "10"))
 
 # Monitoring configuration
-ENABLE_METRICS = os.getenv("ENABLE_METRICS", "true").lower() == "true"
-METRICS_PORT = int(os.getenv("METRICS_PORT", "9090"))
+ENABLE_METRICS = _ENV.get("ENABLE_METRICS", "true").lower() == "true"
+METRICS_PORT = int(_ENV.get("METRICS_PORT", "9090"))
+
+# Log every Nth successful tool call (failures are always logged)
+LOG_SUCCESS_SAMPLE_RATE = max(1, int(_ENV.get("LOG_SUCCESS_SAMPLE_RATE", "1")))
 
 # ============================================================================
 # Structured Logging
@@ -62,17 +72,37 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, level.upper()))
 
-        # JSON formatter
-        handler = logging.StreamHandler()
-        handler.setFormatter(self.JSONFormatter())
-        self.logger.addHandler(handler)
+        # Records are formatted as JSON on the caller's side, then queued for a
+        # background thread to write, so stderr I/O never blocks the event loop
+        log_queue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(self.JSONFormatter())
+        self.logger.addHandler(queue_handler)
+
+        self._listener = QueueListener(log_queue, logging.StreamHandler())
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
     class JSONFormatter(logging.Formatter):
         """Format logs as JSON."""
 
+        # Second-resolution prefix of the last timestamp rendered
+        _cached_second = None
+        _cached_prefix = ""
+
+        def _timestamp(self, created: float) -> str:
+            """Render record.created as ISO 8601 UTC, reformatting only on a new second."""
+            second = int(created)
+            if second != self._cached_second:
+                self._cached_second = second
+                self._cached_prefix = time.strftime(
+                    "%Y-%m-%dT%H:%M:%S", time.gmtime(second)
+                )
+            return f"{self._cached_prefix}.{int((created - second) * 1e6):06d}Z"
+
         def format(self, record):
             log_data = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": self._timestamp(record.created),
                 "level": record.levelname,
                 "message": record.getMessage(),
                 "module": record.module,
@@ -92,27 +122,45 @@ class StructuredLogger:
             if record.exc_info:
                 log_data["exception"] = self.formatException(record.exc_info)
 
-            return json.dumps(log_data)
+            return orjson.dumps(log_data).decode()
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
 
-    def info(self, message: str, **kwargs):
-        extra = {k: v for k, v in kwargs.items()}
+    def info(self, message: str, **extra):
         self.logger.info(message, extra=extra)
 
-    def warning(self, message: str, **kwargs):
-        extra = {k: v for k, v in kwargs.items()}
+    def warning(self, message: str, **extra):
         self.logger.warning(message, extra=extra)
 
-    def error(self, message: str, **kwargs):
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.error(message, extra=extra, exc_info=kwargs.get("exc_info"))
+    def error(self, message: str, **extra):
+        exc_info = extra.pop("exc_info", None)
+        self.logger.error(message, extra=extra, exc_info=exc_info)
+
+    def debug(self, message: str, *args, **extra):
+        self.logger.debug(message, *args, extra=extra)
+
 
-    def debug(self, message: str, **kwargs):
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.debug(message, extra=extra)
+class LogSampler:
+    """Admits one in every `rate` events, for thinning out routine log lines."""
+
+    __slots__ = ("rate", "_count")
+
+    def __init__(self, rate: int):
+        self.rate = rate
+        self._count = 0
+
+    def should_log(self) -> bool:
+        self._count += 1
+        if self._count < self.rate:
+            return False
+        self._count = 0
+        return True
 
 
 # Initialize logger
 logger = StructuredLogger(__name__, LOG_LEVEL)
+success_log_sampler = LogSampler(LOG_SUCCESS_SAMPLE_RATE)
 
 # ============================================================================
 # Rate Limiter
@@ -120,31 +168,62 @@ logger = StructuredLogger(__name__, LOG_LEVEL)
 
 
 class RateLimiter:
-    """Token bucket rate limiter."""
+    """Token bucket rate limiter.
+
+    Tokens are tracked as integer micro-tokens against the monotonic clock,
+    so refills are exact and unaffected by wall-clock adjustments.
+    allow_request never awaits, so concurrent tool calls on the event loop
+    cannot interleave inside it and no lock is needed.
+    """
+
+    __slots__ = (
+        "rate_per_minute",
+        "burst",
+        "_capacity_micro",
+        "_refill_micro_per_minute",
+        "_tokens_micro",
+        "last_update",
+        "total_requests",
+    )
+
+    MICRO = 1_000_000  # micro-tokens per token
+    NS_PER_MINUTE = 60_000_000_000
 
     def __init__(self, rate_per_minute: int, burst: int):
-        self.rate = rate_per_minute / 60.0  # tokens per second
+        self.rate_per_minute = rate_per_minute
         self.burst = burst
-        self.tokens = burst
-        self.last_update = time.time()
-        self.request_counts = defaultdict(int)
-
-    def allow_request(self, client_id: str = "default") -> tuple[bool, Optional[float]]:
-        """Check if request is allowed. Returns (allowed, retry_after_seconds)."""
-        now = time.time()
+        self._capacity_micro = burst * self.MICRO
+        self._refill_micro_per_minute = rate_per_minute * self.MICRO
+        self._tokens_micro = self._capacity_micro
+        self.last_update = time.monotonic_ns()
+        self.total_requests = 0
+
+    def allow_request(self, cost: int = 1) -> tuple[bool, Optional[float]]:
+        """Check if a request costing `cost` tokens is allowed.
+
+        Returns (allowed, retry_after_seconds).
+        """
+        cost_micro = cost * self.MICRO
+        now = time.monotonic_ns()
         elapsed = now - self.last_update
+        self.last_update = now
 
         # Add tokens based on elapsed time
-        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
-        self.last_update = now
+        self._tokens_micro = min(
+            self._capacity_micro,
+            self._tokens_micro
+            + elapsed * self._refill_micro_per_minute // self.NS_PER_MINUTE,
+        )
 
-        if self.tokens >= 1:
-            self.tokens -= 1
-            self.request_counts[client_id] += 1
+        if self._tokens_micro >= cost_micro:
+            self._tokens_micro -= cost_micro
+            self.total_requests += 1
             return True, None
-        else:
-            retry_after = (1 - self.tokens) / self.rate
-            return False, retry_after
+
+        retry_after = (
+            (cost_micro - self._tokens_micro) * 60 / self._refill_micro_per_minute
+        )
+        return False, retry_after
 
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiter statistics."""
@@ -152,8 +231,8 @@ class RateLimiter:
             "enabled": RATE_LIMIT_ENABLED,
             "rate_per_minute": RATE_LIMIT_PER_MINUTE,
             "burst": self.burst,
-            "current_tokens": round(self.tokens, 2),
-            "total_requests": sum(self.request_counts.values()),
+            "current_tokens": round(self._tokens_micro / self.MICRO, 2),
+            "total_requests": self.total_requests,
         }
 
 
@@ -164,77 +243,114 @@ rate_limiter = RateLimiter(RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST)
 # ============================================================================
 
 
+TOOL_NAMES = (
+    "list_watches",
+    "get_watch",
+    "create_watch",
+    "delete_watch",
+    "trigger_check",
+    "trigger_checks",
+    "get_history",
+    "system_info",
+    "get_metrics",
+)
+
+
 class MetricsCollector:
-    """Simple metrics collector for monitoring."""
-
-    def __init__(self):
-        self.metrics = {
-            "requests_total": 0,
-            "requests_success": 0,
-            "requests_failed": 0,
-            "requests_rate_limited": 0,
-            "total_duration_ms": 0,
-            "by_tool": defaultdict(lambda: {"count": 0, "errors": 0, "duration_ms": 0}),
-        }
-        self.start_time = time.time()
+    """Simple metrics collector for monitoring.
+
+    Per-tool stats are preregistered as [count, errors, duration_ns] rows,
+    so recording a request is one dict lookup and a few list stores.
+    Durations are integer nanoseconds and only converted to ms on read.
+    All updates happen synchronously on the event loop thread, so the
+    counters are never contended and need no locking or sharding.
+    """
+
+    __slots__ = (
+        "_by_tool",
+        "requests_total",
+        "requests_success",
+        "requests_failed",
+        "requests_rate_limited",
+        "total_duration_ns",
+        "start_ns",
+    )
+
+    def __init__(self, tool_names: tuple[str, ...]):
+        self._by_tool = {name: [0, 0, 0] for name in tool_names}
+
+        self.requests_total = 0
+        self.requests_success = 0
+        self.requests_failed = 0
+        self.requests_rate_limited = 0
+        self.total_duration_ns = 0
+        self.start_ns = time.monotonic_ns()
 
     def record_request(
-        self, tool_name: str, success: bool, duration_ms: float, rate_limited: bool = False
+        self, tool_name: str, success: bool, duration_ns: int, rate_limited: bool = False
     ):
         """Record a request metric."""
-        self.metrics["requests_total"] += 1
+        self.requests_total += 1
 
         if rate_limited:
-            self.metrics["requests_rate_limited"] += 1
+            self.requests_rate_limited += 1
             return
 
         if success:
-            self.metrics["requests_success"] += 1
+            self.requests_success += 1
         else:
-            self.metrics["requests_failed"] += 1
+            self.requests_failed += 1
 
-        self.metrics["total_duration_ms"] += duration_ms
+        self.total_duration_ns += duration_ns
 
-        tool_metrics = self.metrics["by_tool"][tool_name]
-        tool_metrics["count"] += 1
-        tool_metrics["duration_ms"] += duration_ms
+        row = self._by_tool.get(tool_name)
+        if row is None:
+            return
+        row[0] += 1
+        row[2] += duration_ns
         if not success:
-            tool_metrics["errors"] += 1
+            row[1] += 1
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics."""
-        uptime = time.time() - self.start_time
+        uptime = (time.monotonic_ns() - self.start_ns) / 1_000_000_000
+        total_duration_ms = self.total_duration_ns / 1_000_000
         avg_duration = (
-            self.metrics["total_duration_ms"] / self.metrics["requests_success"]
-            if self.metrics["requests_success"] > 0
+            total_duration_ms / self.requests_success
+            if self.requests_success > 0
             else 0
         )
 
         return {
             "uptime_seconds": round(uptime, 2),
             "requests": {
-                "total": self.metrics["requests_total"],
-                "success": self.metrics["requests_success"],
-                "failed": self.metrics["requests_failed"],
-                "rate_limited": self.metrics["requests_rate_limited"],
+                "total": self.requests_total,
+                "success": self.requests_success,
+                "failed": self.requests_failed,
+                "rate_limited": self.requests_rate_limited,
                 "success_rate": (
-                    round(
-                        self.metrics["requests_success"] / self.metrics["requests_total"] * 100,
-                        2,
-                    )
-                    if self.metrics["requests_total"] > 0
+                    round(self.requests_success / self.requests_total * 100, 2)
+                    if self.requests_total > 0
                     else 0
                 ),
             },
             "performance": {
                 "avg_duration_ms": round(avg_duration, 2),
-                "total_duration_ms": round(self.metrics["total_duration_ms"], 2),
+                "total_duration_ms": round(total_duration_ms, 2),
+            },
+            "by_tool": {
+                name: {
+                    "count": count,
+                    "errors": errors,
+                    "duration_ms": duration_ns / 1_000_000,
+                }
+                for name, (count, errors, duration_ns) in self._by_tool.items()
+                if count
             },
-            "by_tool": dict(self.metrics["by_tool"]),
         }
 
 
-metrics = MetricsCollector()
+metrics = MetricsCollector(TOOL_NAMES)
 
 # ============================================================================
 # Input Validation & Sanitization
@@ -258,31 +374,68 @@ def sanitize_string(value: str, max_length: int = 2048) -> str:
     return value
 
 
+_URL_RE = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
+    r"localhost|"  # localhost
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # IP
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+
+_UUID_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+
 def validate_url(url: str) -> bool:
     """Validate URL format."""
-    import re
-
-    url_pattern = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-        r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # IP
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return bool(url_pattern.match(url))
+    return _URL_RE.match(url) is not None
 
 
 def validate_uuid(uuid_str: str) -> bool:
-    """Validate UUID format."""
-    import re
-
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE,
+    """Validate UUID format.
+
+    UUIDs are fixed-width, so checking the hyphen positions and the
+    character set is enough and avoids running the regex engine.
+    """
+    return (
+        len(uuid_str) == 36
+        and uuid_str[8] == uuid_str[13] == uuid_str[18] == uuid_str[23] == "-"
+        and uuid_str.count("-") == 4
+        and _UUID_CHARS.issuperset(uuid_str)
     )
-    return bool(uuid_pattern.match(uuid_str))
+
+
+def _check_watch_id(watch_id: Any) -> str:
+    """Return watch_id if it is a UUID string, else raise ValueError.
+
+    A UUID cannot contain null bytes or surrounding whitespace, so one
+    validate_uuid call replaces sanitize_string + validate_uuid for watch IDs.
+    """
+    if not isinstance(watch_id, str) or not validate_uuid(watch_id):
+        raise ValueError(f"Invalid watch ID format: {watch_id}")
+    return watch_id
+
+
+# Upper bound on watch IDs per trigger_checks call. Each ID costs one
+# rate-limit token, so the cap never exceeds what the bucket can hold.
+TRIGGER_CHECKS_MAX_IDS = 10
+if RATE_LIMIT_ENABLED:
+    TRIGGER_CHECKS_MAX_IDS = max(1, min(TRIGGER_CHECKS_MAX_IDS, RATE_LIMIT_BURST))
+
+
+def _check_watch_ids(watch_ids: Any) -> list[str]:
+    """Validate a trigger_checks batch and return its IDs without duplicates."""
+    if not watch_ids:
+        raise ValueError("watch_ids is required")
+    if not isinstance(watch_ids, list):
+        raise ValueError("watch_ids must be a list of watch IDs")
+    watch_ids = list(dict.fromkeys(_check_watch_id(watch_id) for watch_id in watch_ids))
+    if len(watch_ids) > TRIGGER_CHECKS_MAX_IDS:
+        raise ValueError(
+            f"watch_ids may contain at most {TRIGGER_CHECKS_MAX_IDS} watch IDs"
+        )
+    return watch_ids
 
 
 # ============================================================================
@@ -293,97 +446,141 @@ def validate_uuid(uuid_str: str) -> bool:
 class ChangeDetectionClient:
     """Enhanced client for interacting with changedetection.io API."""
 
+    # How long idempotent reads may be served from cache
+    LIST_WATCHES_TTL_NS = 2_000_000_000
+    SYSTEM_INFO_TTL_NS = 10_000_000_000
+
     def __init__(self, base_url: str, api_key: str):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.headers = {"x-api-key": api_key} if api_key else {}
         self.timeout = httpx.Timeout(30.0, connect=10.0)
 
+        # Shared client so connections are pooled and kept alive between calls;
+        # HTTP/2 is negotiated over TLS and lets concurrent calls share one socket
+        self._client = httpx.AsyncClient(
+            http2=True,
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+        )
+
+        # endpoint -> (expiry_ns, result), and the fetch currently in flight
+        self._cache: Dict[str, tuple[int, Any]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
     async def _request(
         self, method: str, endpoint: str, data: Optional[dict] = None
     ) -> Any:
         """Make HTTP request with enhanced error handling."""
-        url = f"{self.base_url}{endpoint}"
         request_id = f"{int(time.time() * 1000)}"
 
         logger.debug(
-            f"Making {method} request to {endpoint}",
+            "Making %s request to %s",
+            method,
+            endpoint,
             request_id=request_id,
         )
 
-        async with httpx.AsyncClient() as client:
-            try:
-                kwargs = {
-                    "headers": self.headers,
-                    "timeout": self.timeout,
-                }
+        try:
+            response = await self._client.request(method, endpoint, json=data)
+            response.raise_for_status()
 
-                if method == "GET":
-                    response = await client.get(url, **kwargs)
-                elif method == "POST":
-                    kwargs["json"] = data
-                    response = await client.post(url, **kwargs)
-                elif method == "DELETE":
-                    response = await client.delete(url, **kwargs)
-                elif method == "PUT":
-                    kwargs["json"] = data
-                    response = await client.put(url, **kwargs)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-
-                response.raise_for_status()
-
-                result = response.json() if response.text else {}
-
-                logger.debug(
-                    f"Request successful: {method} {endpoint}",
-                    request_id=request_id,
-                )
+            result = response.json() if response.text else {}
 
-                return result
+            logger.debug(
+                "Request successful: %s %s",
+                method,
+                endpoint,
+                request_id=request_id,
+            )
 
-            except httpx.TimeoutException as e:
-                logger.error(
-                    f"Request timeout: {method} {endpoint}",
-                    request_id=request_id,
-                    exc_info=True,
-                )
-                raise Exception(f"Request timeout after {self.timeout.read}s") from e
+            return result
 
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"HTTP error {e.response.status_code}: {method} {endpoint}",
-                    request_id=request_id,
-                )
-                raise Exception(
-                    f"HTTP {e.response.status_code}: {e.response.text}"
-                ) from e
-
-            except httpx.ConnectError as e:
-                logger.error(
-                    f"Connection error: {method} {endpoint}",
-                    request_id=request_id,
-                    exc_info=True,
-                )
-                raise Exception(f"Cannot connect to {self.base_url}") from e
+        except httpx.TimeoutException as e:
+            logger.error(
+                f"Request timeout: {method} {endpoint}",
+                request_id=request_id,
+                exc_info=True,
+            )
+            raise Exception(f"Request timeout after {self.timeout.read}s") from e
 
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error: {method} {endpoint}",
-                    request_id=request_id,
-                    exc_info=True,
-                )
-                raise
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"HTTP error {e.response.status_code}: {method} {endpoint}",
+                request_id=request_id,
+            )
+            raise Exception(
+                f"HTTP {e.response.status_code}: {e.response.text}"
+            ) from e
+
+        except httpx.ConnectError as e:
+            logger.error(
+                f"Connection error: {method} {endpoint}",
+                request_id=request_id,
+                exc_info=True,
+            )
+            raise Exception(f"Cannot connect to {self.base_url}") from e
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error: {method} {endpoint}",
+                request_id=request_id,
+                exc_info=True,
+            )
+            raise
+
+    async def _cached_get(self, endpoint: str, ttl_ns: int) -> Any:
+        """GET an idempotent endpoint through a short TTL cache.
+
+        Concurrent callers that miss the cache share a single upstream fetch.
+        """
+        entry = self._cache.get(endpoint)
+        if entry is not None and time.monotonic_ns() < entry[0]:
+            return entry[1]
+
+        fetch = self._inflight.get(endpoint)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._request("GET", endpoint))
+            self._inflight[endpoint] = fetch
+            fetch.add_done_callback(
+                lambda done: self._store_cached(endpoint, ttl_ns, done)
+            )
+        # Shielded so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(fetch)
+
+    def _store_cached(self, endpoint: str, ttl_ns: int, fetch: asyncio.Future):
+        """Cache a finished fetch unless it was invalidated while in flight."""
+        # Read the outcome before any early return, so a failed fetch that was
+        # invalidated with no waiters left is not logged as never retrieved
+        failed = fetch.cancelled() or fetch.exception() is not None
+        if self._inflight.get(endpoint) is not fetch:
+            return
+        del self._inflight[endpoint]
+        if not failed:
+            self._cache[endpoint] = (time.monotonic_ns() + ttl_ns, fetch.result())
+
+    def _invalidate(self, endpoint: str):
+        """Drop any cached or in-flight result for endpoint."""
+        self._cache.pop(endpoint, None)
+        self._inflight.pop(endpoint, None)
 
     async def list_watches(self) -> dict:
         """List all watches."""
-        return await self._request("GET", "/api/v1/watch")
+        return await self._cached_get("/api/v1/watch", self.LIST_WATCHES_TTL_NS)
 
     async def get_watch(self, watch_id: str) -> dict:
         """Get details of a specific watch."""
-        watch_id = sanitize_string(watch_id)
-        if not validate_uuid(watch_id):
-            raise ValueError(f"Invalid watch ID format: {watch_id}")
+        watch_id = _check_watch_id(watch_id)
         return await self._request("GET", f"/api/v1/watch/{watch_id}")
 
     async def create_watch(self, url: str, tag: Optional[str] = None) -> dict:
@@ -396,32 +593,56 @@ class ChangeDetectionClient:
         if tag:
             data["tag"] = sanitize_string(tag, max_length=100)
 
-        return await self._request("POST", "/api/v1/watch", data)
+        try:
+            return await self._request("POST", "/api/v1/watch", data)
+        finally:
+            self._invalidate("/api/v1/watch")
 
     async def delete_watch(self, watch_id: str) -> dict:
         """Delete a watch."""
-        watch_id = sanitize_string(watch_id)
-        if not validate_uuid(watch_id):
-            raise ValueError(f"Invalid watch ID format: {watch_id}")
-        return await self._request("DELETE", f"/api/v1/watch/{watch_id}")
+        watch_id = _check_watch_id(watch_id)
+        try:
+            return await self._request("DELETE", f"/api/v1/watch/{watch_id}")
+        finally:
+            self._invalidate("/api/v1/watch")
 
     async def trigger_check(self, watch_id: str) -> dict:
         """Trigger a check for a specific watch."""
-        watch_id = sanitize_string(watch_id)
-        if not validate_uuid(watch_id):
-            raise ValueError(f"Invalid watch ID format: {watch_id}")
+        watch_id = _check_watch_id(watch_id)
         return await self._request("GET", f"/api/v1/watch/{watch_id}/trigger")
 
+    async def trigger_checks(self, watch_ids: list[str]) -> dict:
+        """Trigger checks for several watches concurrently.
+
+        The first failure cancels the remaining requests rather than leaving
+        them running against the API. Duplicate IDs are triggered once.
+        """
+        return await self._trigger_checks(_check_watch_ids(watch_ids))
+
+    async def _trigger_checks(self, watch_ids: list[str]) -> dict:
+        """Trigger checks for watch IDs already validated by _check_watch_ids."""
+        tasks = [
+            asyncio.ensure_future(
+                self._request("GET", f"/api/v1/watch/{watch_id}/trigger")
+            )
+            for watch_id in watch_ids
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(watch_ids, results, strict=True))
+
     async def get_history(self, watch_id: str) -> dict:
         """Get history of changes for a watch."""
-        watch_id = sanitize_string(watch_id)
-        if not validate_uuid(watch_id):
-            raise ValueError(f"Invalid watch ID format: {watch_id}")
+        watch_id = _check_watch_id(watch_id)
         return await self._request("GET", f"/api/v1/watch/{watch_id}/history")
 
     async def system_info(self) -> dict:
         """Get system information."""
-        return await self._request("GET", "/api/v1/systeminfo")
+        return await self._cached_get("/api/v1/systeminfo", self.SYSTEM_INFO_TTL_NS)
 
 
 # Initialize client
@@ -438,230 +659,315 @@ app = Server("changedetection-mcp-server")
 # ============================================================================
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="list_watches",
-            description="List all website watches configured in changedetection.io",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="get_watch",
-            description="Get detailed information about a specific watch",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
-                        "type": "string",
-                        "description": "The UUID of the watch to retrieve",
-                        "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                    }
-                },
-                "required": ["watch_id"],
+_NO_ARGS_SCHEMA = {"type": "object", "properties": {}, "required": []}
+_UUID_PATTERN = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+# Tool definitions never change at runtime, so they are built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_watches",
+        description="List all website watches configured in changedetection.io",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="get_watch",
+        description="Get detailed information about a specific watch",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "The UUID of the watch to retrieve",
+                    "pattern": _UUID_PATTERN,
+                }
             },
-        ),
-        Tool(
-            name="create_watch",
-            description="Create a new watch to monitor a website for changes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "The URL to monitor (must be http:// or https://)",
-                        "format": "uri",
-                    },
-                    "tag": {
-                        "type": "string",
-                        "description": "Optional tag to categorize the watch (max 100 chars)",
-                        "maxLength": 100,
-                    },
+            "required": ["watch_id"],
+        },
+    ),
+    Tool(
+        name="create_watch",
+        description="Create a new watch to monitor a website for changes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The URL to monitor (must be http:// or https://)",
+                    "format": "uri",
                 },
-                "required": ["url"],
-            },
-        ),
-        Tool(
-            name="delete_watch",
-            description="Delete a watch and stop monitoring",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
-                        "type": "string",
-                        "description": "The UUID of the watch to delete",
-                        "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                    }
+                "tag": {
+                    "type": "string",
+                    "description": "Optional tag to categorize the watch (max 100 chars)",
+                    "maxLength": 100,
                 },
-                "required": ["watch_id"],
             },
-        ),
-        Tool(
-            name="trigger_check",
-            description="Manually trigger a change detection check",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
-                        "type": "string",
-                        "description": "The UUID of the watch to check",
-                        "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                    }
-                },
-                "required": ["watch_id"],
+            "required": ["url"],
+        },
+    ),
+    Tool(
+        name="delete_watch",
+        description="Delete a watch and stop monitoring",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "The UUID of the watch to delete",
+                    "pattern": _UUID_PATTERN,
+                }
             },
-        ),
-        Tool(
-            name="get_history",
-            description="Get the history of detected changes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "watch_id": {
+            "required": ["watch_id"],
+        },
+    ),
+    Tool(
+        name="trigger_check",
+        description="Manually trigger a change detection check",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "The UUID of the watch to check",
+                    "pattern": _UUID_PATTERN,
+                }
+            },
+            "required": ["watch_id"],
+        },
+    ),
+    Tool(
+        name="trigger_checks",
+        description="Manually trigger change detection checks for several watches at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_ids": {
+                    "type": "array",
+                    "description": "The UUIDs of the watches to check",
+                    "items": {
                         "type": "string",
-                        "description": "The UUID of the watch",
-                        "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                    }
-                },
-                "required": ["watch_id"],
+                        "pattern": _UUID_PATTERN,
+                    },
+                    "minItems": 1,
+                    "maxItems": TRIGGER_CHECKS_MAX_IDS,
+                    "uniqueItems": True,
+                }
+            },
+            "required": ["watch_ids"],
+        },
+    ),
+    Tool(
+        name="get_history",
+        description="Get the history of detected changes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "watch_id": {
+                    "type": "string",
+                    "description": "The UUID of the watch",
+                    "pattern": _UUID_PATTERN,
+                }
             },
-        ),
-        Tool(
-            name="system_info",
-            description="Get system information about the changedetection.io instance",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-        Tool(
-            name="get_metrics",
-            description="Get server metrics and statistics",
-            inputSchema={"type": "object", "properties": {}, "required": []},
-        ),
-    ]
+            "required": ["watch_id"],
+        },
+    ),
+    Tool(
+        name="system_info",
+        description="Get system information about the changedetection.io instance",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="get_metrics",
+        description="Get server metrics and statistics",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+async def _server_metrics() -> dict:
+    """Collect server metrics and rate limiter statistics."""
+    return {
+        "server_metrics": metrics.get_metrics(),
+        "rate_limiter": rate_limiter.get_stats(),
+        "version": SERVER_VERSION,
+    }
+
+
+# Tool name -> (handler, required argument names, optional argument names);
+# arguments are passed to the handler positionally in that order
+_DISPATCH = {
+    "list_watches": (client.list_watches, (), ()),
+    "get_watch": (client.get_watch, ("watch_id",), ()),
+    "create_watch": (client.create_watch, ("url",), ("tag",)),
+    "delete_watch": (client.delete_watch, ("watch_id",), ()),
+    "trigger_check": (client.trigger_check, ("watch_id",), ()),
+    # call_tool validates the batch itself to price it, then skips revalidation
+    "trigger_checks": (client._trigger_checks, ("watch_ids",), ()),
+    "get_history": (client.get_history, ("watch_id",), ()),
+    "system_info": (client.system_info, (), ()),
+    "get_metrics": (_server_metrics, (), ()),
+}
+
+
+# Only retry_after varies, so the throttled response is formatted, not serialized
+_RATE_LIMIT_TEMPLATE = (
+    '{"error":"rate_limit_exceeded",'
+    '"message":"Rate limit exceeded. Retry after %.1fs",'
+    '"retry_after":%.3f}'
+)
+
+_VALIDATION_ERROR_PREFIX = '{"success":false,"error":"validation_error","message":'
+
+
+def _validation_error_text(message: str) -> str:
+    """Render a validation error payload around a JSON-escaped message."""
+    return _VALIDATION_ERROR_PREFIX + orjson.dumps(message).decode() + "}"
+
+
+# Errors with no dynamic part are rendered once and shared between responses
+_STATIC_VALIDATION_ERRORS = {
+    message: TextContent(type="text", text=_validation_error_text(message))
+    for message in {
+        f"{key} is required"
+        for _, required, _ in _DISPATCH.values()
+        for key in required
+    }
+}
+_EXECUTION_ERROR = TextContent(
+    type="text",
+    text=orjson.dumps(
+        {
+            "success": False,
+            "error": "execution_error",
+            "message": "An error occurred processing your request",
+        }
+    ).decode(),
+)
+_UNKNOWN_TOOL = TextContent(type="text", text=_validation_error_text("Unknown tool"))
+_COMPLETED_PREFIX = "Tool call completed: "
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls with enhanced features."""
-    start_time = time.time()
+    # Reject unknown names before touching the rate limiter, metrics or logs
+    entry = _DISPATCH.get(name)
+    if entry is None:
+        logger.debug("Unknown tool: %s", name)
+        return [_UNKNOWN_TOOL]
+
+    start_ns = time.perf_counter_ns()
     success = False
+    rate_limited = False
 
     try:
+        # A trigger_checks batch is validated up front so it can be charged
+        # one token per watch it triggers
+        cost = 1
+        if name == "trigger_checks":
+            watch_ids = _check_watch_ids(arguments.get("watch_ids"))
+            arguments = {**arguments, "watch_ids": watch_ids}
+            cost = len(watch_ids)
+
         # Check rate limiting
         if RATE_LIMIT_ENABLED and name != "get_metrics":
-            allowed, retry_after = rate_limiter.allow_request()
+            allowed, retry_after = rate_limiter.allow_request(cost)
             if not allowed:
-                metrics.record_request(name, False, 0, rate_limited=True)
+                rate_limited = True
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(
-                            {
-                                "error": "rate_limit_exceeded",
-                                "message": f"Rate limit exceeded. Retry after {retry_after:.1f}s",
-                                "retry_after": retry_after,
-                            },
-                            indent=2,
-                        ),
+                        text=_RATE_LIMIT_TEMPLATE % (retry_after, retry_after),
                     )
                 ]
 
         # Route to appropriate handler
-        if name == "list_watches":
-            result = await client.list_watches()
-            success = True
-
-        elif name == "get_watch":
-            watch_id = arguments.get("watch_id")
-            if not watch_id:
-                raise ValueError("watch_id is required")
-            result = await client.get_watch(watch_id)
-            success = True
-
-        elif name == "create_watch":
-            url = arguments.get("url")
-            tag = arguments.get("tag")
-            if not url:
-                raise ValueError("url is required")
-            result = await client.create_watch(url, tag)
-            success = True
-
-        elif name == "delete_watch":
-            watch_id = arguments.get("watch_id")
-            if not watch_id:
-                raise ValueError("watch_id is required")
-            result = await client.delete_watch(watch_id)
-            success = True
-
-        elif name == "trigger_check":
-            watch_id = arguments.get("watch_id")
-            if not watch_id:
-                raise ValueError("watch_id is required")
-            result = await client.trigger_check(watch_id)
-            success = True
-
-        elif name == "get_history":
-            watch_id = arguments.get("watch_id")
-            if not watch_id:
-                raise ValueError("watch_id is required")
-            result = await client.get_history(watch_id)
-            success = True
-
-        elif name == "system_info":
-            result = await client.system_info()
-            success = True
-
-        elif name == "get_metrics":
-            result = {
-                "server_metrics": metrics.get_metrics(),
-                "rate_limiter": rate_limiter.get_stats(),
-                "version": SERVER_VERSION,
-            }
-            success = True
-
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        handler, required, optional = entry
+        args = []
+        for key in required:
+            value = arguments.get(key)
+            if not value:
+                raise ValueError(f"{key} is required")
+            args.append(value)
+        for key in optional:
+            args.append(arguments.get(key))
+        result = await handler(*args)
+        success = True
 
         # Format successful response
         response = {"success": True, "data": result}
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+        return [TextContent(type="text", text=orjson.dumps(response).decode())]
 
     except ValueError as e:
-        logger.warning(f"Validation error in {name}: {str(e)}", tool_name=name)
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(
-                    {
-                        "success": False,
-                        "error": "validation_error",
-                        "message": str(e),
-                    },
-                    indent=2,
-                ),
-            )
-        ]
+        message = str(e)
+        logger.warning(f"Validation error in {name}: {message}", tool_name=name)
+        content = _STATIC_VALIDATION_ERRORS.get(message)
+        if content is None:
+            content = TextContent(type="text", text=_validation_error_text(message))
+        return [content]
 
     except Exception as e:
         logger.error(f"Error executing {name}: {str(e)}", tool_name=name, exc_info=True)
+        if not DEBUG_MODE:
+            return [_EXECUTION_ERROR]
         error_response = {
             "success": False,
             "error": "execution_error",
-            "message": str(e) if DEBUG_MODE else "An error occurred processing your request",
+            "message": str(e),
         }
-        return [TextContent(type="text", text=json.dumps(error_response, indent=2))]
+        return [TextContent(type="text", text=orjson.dumps(error_response).decode())]
 
     finally:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ns = time.perf_counter_ns() - start_ns
         if ENABLE_METRICS:
-            metrics.record_request(name, success, duration_ms)
-        logger.info(
-            f"Tool call completed: {name}",
-            tool_name=name,
-            duration_ms=round(duration_ms, 2),
-            success=success,
-        )
+            metrics.record_request(name, success, duration_ns, rate_limited=rate_limited)
+        # Failures are always logged; successes are sampled
+        log_completion = not success or success_log_sampler.should_log()
+        if log_completion and logger.is_enabled_for(logging.INFO):
+            logger.info(
+                _COMPLETED_PREFIX + name,
+                tool_name=name,
+                duration_ms=round(duration_ns / 1_000_000, 2),
+                success=success,
+            )
+
+
+class _CoalescingStdout:
+    """Async stdout for stdio_server that writes each message in one thread hop.
+
+    The stdio transport writes each outgoing message as one newline-terminated
+    string and then flushes; with anyio's default file wrapper those are two
+    worker-thread round trips. Here a write() that completes a line is written
+    and flushed in a single blocking call, so output never depends on the
+    transport calling flush(). Partial lines are buffered until the newline
+    arrives or flush() is called.
+    """
+
+    def __init__(self, stream: TextIOWrapper):
+        self._stream = stream
+        self._pending: list[str] = []
+
+    async def write(self, data: str) -> None:
+        self._pending.append(data)
+        if data.endswith("\n"):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        data = "".join(self._pending)
+        self._pending.clear()
+        await anyio.to_thread.run_sync(self._write_and_flush, data)
+
+    def _write_and_flush(self, data: str) -> None:
+        self._stream.write(data)
+        self._stream.flush()
 
 
 async def main():
@@ -674,8 +980,12 @@ async def main():
         metrics=ENABLE_METRICS,
     )
 
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    try:
+        stdout = _CoalescingStdout(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+        async with stdio_server(stdout=stdout) as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await client.aclose()
 
 
 if __name__ == "__main__":
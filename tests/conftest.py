@@ -0,0 +1,31 @@
+"""Shared fixtures for the server tests."""
+
+import os
+
+import httpx
+import pytest
+
+# server_enhanced reads its configuration once at import
+os.environ.setdefault("CHANGEDETECTION_API_KEY", "test-key")
+os.environ.setdefault("RATE_LIMIT_BURST", "10")
+
+import server_enhanced  # noqa: E402
+
+
+@pytest.fixture
+async def make_client():
+    """Build ChangeDetectionClients whose HTTP calls go to a handler."""
+    clients = []
+
+    def factory(handler):
+        client = server_enhanced.ChangeDetectionClient("http://changedetection", "k")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            base_url=client.base_url,
+        )
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        await client.aclose()
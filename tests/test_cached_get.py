@@ -0,0 +1,121 @@
+"""Tests for the single-flight TTL cache behind list_watches and system_info."""
+
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+WATCH_PATH = "/api/v1/watch"
+
+
+class GatedAPI:
+    """Mock API whose list responses wait until the test releases them."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.list_calls = 0
+        self.statuses = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"uuid": "new"})
+        self.list_calls += 1
+        call = self.list_calls
+        await self.gate.wait()
+        status = self.statuses.pop(0) if self.statuses else 200
+        return httpx.Response(status, json={"call": call})
+
+
+async def _wait_for(predicate):
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+def api():
+    return GatedAPI()
+
+
+@pytest.fixture
+def client(make_client, api):
+    return make_client(api)
+
+
+async def test_concurrent_callers_share_one_fetch(client, api):
+    callers = [asyncio.ensure_future(client.list_watches()) for _ in range(5)]
+    await _wait_for(lambda: api.list_calls == 1)
+    api.gate.set()
+
+    results = await asyncio.gather(*callers)
+
+    assert results == [{"call": 1}] * 5
+    assert await client.list_watches() == {"call": 1}
+    assert api.list_calls == 1
+
+
+async def test_errors_are_not_cached(client, api):
+    api.statuses = [500]
+    api.gate.set()
+
+    with pytest.raises(Exception, match="HTTP 500"):
+        await client.list_watches()
+
+    assert await client.list_watches() == {"call": 2}
+    assert api.list_calls == 2
+
+
+@pytest.mark.parametrize("mutation", ["create_watch", "delete_watch"])
+async def test_mutation_invalidates_inflight_fetch(client, api, mutation):
+    stale = asyncio.ensure_future(client.list_watches())
+    await _wait_for(lambda: api.list_calls == 1)
+
+    if mutation == "create_watch":
+        await client.create_watch("https://example.com")
+    else:
+        await client.delete_watch("11111111-1111-1111-1111-111111111111")
+    api.gate.set()
+
+    assert await stale == {"call": 1}
+    assert await client.list_watches() == {"call": 2}
+    assert api.list_calls == 2
+
+
+async def test_cancelled_sole_waiter_keeps_shared_fetch(client, api):
+    waiter = asyncio.ensure_future(client.list_watches())
+    await _wait_for(lambda: api.list_calls == 1)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    api.gate.set()
+
+    assert await client.list_watches() == {"call": 1}
+    assert api.list_calls == 1
+
+
+async def test_orphaned_failure_is_retrieved(client, api):
+    loop = asyncio.get_running_loop()
+    reported = []
+    loop.set_exception_handler(lambda _, context: reported.append(context))
+    try:
+        waiter = asyncio.ensure_future(client.list_watches())
+        await _wait_for(lambda: api.list_calls == 1)
+        fetch = client._inflight[WATCH_PATH]
+
+        client._invalidate(WATCH_PATH)
+        waiter.cancel()
+        api.statuses = [500]
+        api.gate.set()
+        await asyncio.wait([fetch])
+        await asyncio.sleep(0)
+
+        del fetch, waiter
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert reported == []
@@ -0,0 +1,136 @@
+"""Tests for the trigger_checks tool and its rate-limit accounting."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import server_enhanced
+
+WATCH_A = "11111111-1111-1111-1111-111111111111"
+WATCH_B = "22222222-2222-2222-2222-222222222222"
+WATCH_C = "33333333-3333-3333-3333-333333333333"
+
+
+def _watch_id(path: str) -> str:
+    return path.split("/")[4]
+
+
+def _recording_handler(paths: list):
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"triggered": _watch_id(request.url.path)})
+
+    return handler
+
+
+@pytest.fixture
+def tool_client(make_client, monkeypatch):
+    """Route call_tool through a mocked client and a fresh rate limiter."""
+    paths = []
+    client = make_client(_recording_handler(paths))
+    monkeypatch.setitem(
+        server_enhanced._DISPATCH,
+        "trigger_checks",
+        (client._trigger_checks, ("watch_ids",), ()),
+    )
+    monkeypatch.setattr(server_enhanced, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(
+        server_enhanced, "rate_limiter", server_enhanced.RateLimiter(60, 10)
+    )
+    return paths
+
+
+async def _call(arguments: dict) -> dict:
+    result = await server_enhanced.call_tool("trigger_checks", arguments)
+    return orjson.loads(result[0].text)
+
+
+async def test_duplicates_are_triggered_once(make_client):
+    paths = []
+    client = make_client(_recording_handler(paths))
+
+    result = await client.trigger_checks([WATCH_A, WATCH_B, WATCH_A])
+
+    assert sorted(paths) == sorted(
+        f"/api/v1/watch/{watch_id}/trigger" for watch_id in (WATCH_A, WATCH_B)
+    )
+    assert list(result) == [WATCH_A, WATCH_B]
+    assert result[WATCH_A] == {"triggered": WATCH_A}
+
+
+async def test_batch_over_cap_is_rejected(make_client):
+    paths = []
+    client = make_client(_recording_handler(paths))
+    watch_ids = [
+        f"{i:08x}-1111-1111-1111-111111111111"
+        for i in range(server_enhanced.TRIGGER_CHECKS_MAX_IDS + 1)
+    ]
+
+    with pytest.raises(ValueError, match="at most"):
+        await client.trigger_checks(watch_ids)
+    assert paths == []
+
+
+@pytest.mark.parametrize(
+    "watch_ids, message",
+    [
+        (None, "watch_ids is required"),
+        ([], "watch_ids is required"),
+        (WATCH_A, "watch_ids must be a list of watch IDs"),
+        (["not-a-uuid"], "Invalid watch ID format: not-a-uuid"),
+    ],
+)
+async def test_invalid_batches_are_rejected(tool_client, watch_ids, message):
+    response = await _call({"watch_ids": watch_ids})
+
+    assert response["error"] == "validation_error"
+    assert response["message"] == message
+    assert tool_client == []
+    assert server_enhanced.rate_limiter.total_requests == 0
+
+
+async def test_each_unique_id_costs_one_token(tool_client):
+    response = await _call({"watch_ids": [WATCH_A, WATCH_B, WATCH_C, WATCH_A]})
+
+    assert response["success"] is True
+    assert len(tool_client) == 3
+    assert server_enhanced.rate_limiter.get_stats()["current_tokens"] == pytest.approx(
+        7, abs=0.01
+    )
+
+
+async def test_batch_larger_than_remaining_tokens_is_throttled(tool_client):
+    limiter = server_enhanced.rate_limiter
+    for _ in range(8):
+        assert limiter.allow_request()[0]
+
+    response = await _call({"watch_ids": [WATCH_A, WATCH_B, WATCH_C]})
+
+    assert response["error"] == "rate_limit_exceeded"
+    assert response["retry_after"] > 0
+    assert tool_client == []
+
+
+async def test_first_failure_cancels_remaining_requests(make_client):
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        watch_id = _watch_id(request.url.path)
+        if watch_id == WATCH_A:
+            return httpx.Response(500, text="boom")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(watch_id)
+            raise
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+
+    with pytest.raises(Exception, match="HTTP 500"):
+        await client.trigger_checks([WATCH_B, WATCH_A, WATCH_C])
+    await asyncio.sleep(0)
+
+    assert sorted(cancelled) == sorted([WATCH_B, WATCH_C])